@@ -29,7 +29,7 @@ def _():
         create_temp_input,
         get_current_log_file,
         handle_default_corpus_creation,
-        summarize_corpus_selection,
+        render_corpus_summaries,
     )
 
     from remarx.sentence.corpus import FileInput
@@ -45,7 +45,7 @@ def _():
         logging,
         mo,
         pathlib,
-        summarize_corpus_selection,
+        render_corpus_summaries,
     )
 
 
@@ -165,12 +165,12 @@ def _(default_dirs, default_dirs_ready, mo, pathlib):
 
 @app.cell
 def _(mo, original_csv_browser, pathlib, reuse_csv_browser):
-    # Process file selections for quotation detection
-    original_selections = original_csv_browser.value or []
-    reuse_csvs = reuse_csv_browser.value or []
-
-    # Convert file browser selections to paths for original corpora
-    original_csvs = [pathlib.Path(_sel.path) for _sel in original_selections]
+    # Process file selections for quotation detection;
+    # keep only the selected paths rather than the browser selection objects
+    original_csvs = [
+        pathlib.Path(_sel.path) for _sel in original_csv_browser.value or []
+    ]
+    reuse_csvs = [pathlib.Path(_sel.path) for _sel in reuse_csv_browser.value or []]
 
     original_msg = (
         f"{len(original_csvs)} file{'s' if len(original_csvs) > 1 else ''} selected"
@@ -222,63 +222,23 @@ def _(mo, original_csv_browser, pathlib, reuse_csv_browser):
 
 
 @app.cell
-def _(mo, original_csvs, pathlib, summarize_corpus_selection):
-    original_summaries = []
-    for csv_path in original_csvs:
-        # summarize_corpus_selection expects an object with a path attribute or a path
-        # Create a simple object with path attribute
-        _selection_obj = type('obj', (object,), {'path': csv_path})()
-        _summary = summarize_corpus_selection(_selection_obj)
-        if _summary:
-            original_summaries.append(_summary)
-
-    if original_summaries:
-        original_content = mo.vstack(
-            [
-                mo.md("#### Selected Original Corpora"),
-                mo.ui.table(
-                    original_summaries,
-                    page_size=min(10, len(original_summaries)),
-                    selection=None,  # display only
-                    show_download=False,  # hide download control
-                ).style(max_height="260px", overflow="auto"),
-            ]
-        )
-    else:
-        original_content = mo.callout("No original corpora selected yet.", kind="info")
-
-    original_content
-    return (original_summaries,)
+def _(original_csvs, render_corpus_summaries):
+    render_corpus_summaries(
+        original_csvs,
+        heading="Selected Original Corpora",
+        empty_message="No original corpora selected yet.",
+    )
+    return
 
 
 @app.cell
-def _(mo, pathlib, reuse_csvs, summarize_corpus_selection):
-    reuse_summaries = []
-    for _selection in reuse_csvs:
-        # reuse_csvs contains file browser selection objects with a path attribute
-        _sel_path = pathlib.Path(_selection.path)
-        if _sel_path.is_file() and _sel_path.suffix == ".csv":
-            _summary = summarize_corpus_selection(_selection)
-            if _summary:
-                reuse_summaries.append(_summary)
-
-    if reuse_summaries:
-        reuse_content = mo.vstack(
-            [
-                mo.md("#### Selected Reuse Corpora"),
-                mo.ui.table(
-                    reuse_summaries,
-                    page_size=min(10, len(reuse_summaries)),
-                    selection=None,  # display only
-                    show_download=False,  # hide download control
-                ).style(max_height="260px", overflow="auto"),
-            ]
-        )
-    else:
-        reuse_content = mo.callout("No reuse corpora selected yet.", kind="info")
-
-    reuse_content
-    return (reuse_summaries,)
+def _(render_corpus_summaries, reuse_csvs):
+    render_corpus_summaries(
+        reuse_csvs,
+        heading="Selected Reuse Corpora",
+        empty_message="No reuse corpora selected yet.",
+    )
+    return
 
 
 @app.cell
@@ -467,12 +427,10 @@ def _(mo):
 
 
 @app.cell
-def _(consolidate_quotes, mo, original_csvs, output_dir_path, pathlib, reuse_csvs):
+def _(consolidate_quotes, mo, original_csvs, output_dir_path, reuse_csvs):
     # Determine inputs based on file & folder selections
-    # original_csvs is now a list of pathlib.Path objects
-    # reuse_csvs is still a list of file browser selection objects
-    reuse_file = reuse_csvs[0] if reuse_csvs else None
-    reuse_file_path = pathlib.Path(reuse_file.path) if reuse_file else None
+    # original_csvs and reuse_csvs are lists of pathlib.Path objects
+    reuse_file_path = reuse_csvs[0] if reuse_csvs else None
 
     output_csv = None
     if original_csvs and reuse_file_path and output_dir_path:
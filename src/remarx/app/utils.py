@@ -10,6 +10,7 @@ import webbrowser
 from collections.abc import AsyncGenerator, Generator
 from contextlib import asynccontextmanager
 from datetime import datetime
+from functools import lru_cache
 from typing import Protocol, runtime_checkable
 
 import marimo as mo
@@ -156,28 +157,38 @@ def summarize_corpus_selection(
     if not path.is_file():
         return None
 
+    # summaries are cached by path and modification time, since the same
+    # corpus selections are summarized again whenever the notebook reruns;
+    # return a copy so the cached summary can't be modified
+    return dict(_summarize_corpus_file(path, path.stat().st_mtime_ns))
+
+
+@lru_cache(maxsize=128)
+def _summarize_corpus_file(path: pathlib.Path, mtime_ns: int) -> dict[str, int | str]:
+    """
+    Compute corpus statistics for a sentence corpus CSV file. The modification
+    time is only used as part of the cache key, so that summaries for updated
+    files are recomputed.
+    """
     # Use lazy scanning so even large corpora only require lightweight
-    # aggregations while collecting summary statistics.
+    # aggregations while collecting summary statistics; all counts are
+    # computed in a single query so the file is only scanned once.
     corpus = pl.scan_csv(path, infer_schema_length=0)
-    total_sentences = corpus.select(pl.len()).collect().item()
-
+    counts = [pl.len().alias("total")]
     if "section_type" in corpus.collect_schema():
-        counts = (
-            corpus.group_by("section_type").agg(pl.len().alias("sentences")).collect()
+        section = pl.col("section_type")
+        counts.extend(
+            [
+                (section == "text").sum().alias("text"),
+                (section == "footnote").sum().alias("footnote"),
+            ]
         )
-        body_sentences = int(
-            counts.filter(pl.col("section_type") == "text")["sentences"].sum()
-        )
-        footnote_sentences = int(
-            counts.filter(pl.col("section_type") == "footnote")["sentences"].sum()
-        )
-    else:
-        body_sentences = total_sentences
-        footnote_sentences = 0
+    summary = corpus.select(counts).collect().row(0, named=True)
+    total_sentences = summary["total"]
+    body_sentences = int(summary.get("text", total_sentences))
+    footnote_sentences = int(summary.get("footnote", 0))
 
-    last_updated = datetime.fromtimestamp(path.stat().st_mtime).strftime(
-        "%Y-%m-%d %H:%M:%S"
-    )
+    last_updated = datetime.fromtimestamp(mtime_ns / 1e9).strftime("%Y-%m-%d %H:%M:%S")
 
     return {
         "filename": path.name,
@@ -188,6 +199,38 @@ def summarize_corpus_selection(
     }
 
 
+def render_corpus_summaries(
+    selections: list[_HasPath | str | pathlib.Path],
+    heading: str,
+    empty_message: str,
+) -> mo.Html:
+    """
+    Summarize a list of sentence corpus selections and render them as a
+    display-only table under the specified heading. Selections that can't be
+    summarized are skipped; if none remain, returns an info callout with
+    the empty message instead.
+    """
+    summaries = [
+        summary
+        for summary in map(summarize_corpus_selection, selections)
+        if summary is not None
+    ]
+    if not summaries:
+        return mo.callout(empty_message, kind="info")
+
+    return mo.vstack(
+        [
+            mo.md(f"#### {heading}"),
+            mo.ui.table(
+                summaries,
+                page_size=min(10, len(summaries)),
+                selection=None,  # display only
+                show_download=False,  # hide download control
+            ).style(max_height="260px", overflow="auto"),
+        ]
+    )
+
+
 def handle_default_corpus_creation(
     button: mo.ui.run_button,
     default_dirs_initial: CorpusPath,
@@ -4,6 +4,7 @@ Library for generating sentence embeddings from pretrained Sentence Transformer
 
 import logging
 import pathlib
+from functools import cache
 from timeit import default_timer as time
 
 import numpy as np
@@ -15,6 +16,17 @@ logger = logging.getLogger(__name__)
 DEFAULT_MODEL = "paraphrase-multilingual-mpnet-base-v2"
 
 
+@cache
+def load_model(model_name: str) -> SentenceTransformer:
+    """
+    Load the specified pretrained Sentence Transformer model. Loaded models
+    are cached by name, so model weights are only loaded once per session
+    even when embeddings are generated for multiple corpora.
+    """
+    logger.debug(f"Loading sentence transformer model {model_name}")
+    return SentenceTransformer(model_name)
+
+
 def get_cached_embeddings(
     source_file: pathlib.Path,
     sentences: list[str],
@@ -24,6 +36,9 @@ def get_cached_embeddings(
     """
     Get sentence embeddings, with file caching based on source file.
 
+    Cached embeddings are only used when the cache file is newer than the
+    source file and has one embedding per sentence.
+
     Returns a tuple of embeddings array and a boolean indicating whether
     the data was loaded from cache.
     """
@@ -34,9 +49,18 @@ def get_cached_embeddings(
     # if file exists and has non-zero size, check modification time
     if cache_file.exists() and cache_file.stat().st_size:
         if cache_file.stat().st_mtime > source_file.stat().st_mtime:
-            with cache_file.open("rb") as cache_filehandle:
-                logger.info(f"Loading embeddings from {cache_file}")
-                return (np.load(cache_filehandle), True)
+            # memory-map the cached array (read-only) so vectors are
+            # paged in from disk as needed, rather than read up front
+            embeddings = np.load(cache_file, mmap_mode="r")
+            if len(embeddings) == len(sentences):
+                logger.info(f"Loaded embeddings from {cache_file}")
+                return (embeddings, True)
+            logger.info(
+                f"Cached embeddings file {cache_file} has {len(embeddings):,} embeddings "
+                + f"but source file {source_file} has {len(sentences):,} sentences"
+            )
+            # release the memory map before the cache file is overwritten
+            del embeddings
         else:
             logger.info(
                 f"Cached embeddings file {cache_file} exists but source file {source_file} is newer"
@@ -48,7 +72,13 @@ def get_cached_embeddings(
     )
     with cache_file.open("wb") as cache_filehandle:
         logger.info(f"Caching embeddings to {cache_file}")
-        np.save(cache_filehandle, embeddings, allow_pickle=True)
+        # save as a plain float32 array (no pickled objects), so the
+        # cache can be memory-mapped when loaded
+        np.save(
+            cache_filehandle,
+            embeddings.astype(np.float32, copy=False),
+            allow_pickle=False,
+        )
     return (embeddings, False)
 
 
@@ -67,14 +97,29 @@ def get_sentence_embeddings(
     :return: 2-dimensional numpy array of normalized sentence embeddings with shape [# sents, # dims]
     """
 
+    # Identical sentences (e.g., repeated headers in OCR text) only need to
+    # be encoded once; map each sentence to the position of its first occurrence
+    sentence_positions: dict[str, int] = {}
+    positions = [
+        sentence_positions.setdefault(sentence, len(sentence_positions))
+        for sentence in sentences
+    ]
+    unique_sentences = list(sentence_positions)
+
     # Generate embeddings using the specified model
     start = time()
-    model = SentenceTransformer(model_name)
+    model = load_model(model_name)
     embeddings = model.encode(
-        sentences,
+        unique_sentences,
         normalize_embeddings=True,
         show_progress_bar=show_progress_bar,
     )
+    # expand back to one embedding per input sentence if any were duplicates
+    if len(unique_sentences) < len(sentences):
+        logger.debug(
+            f"Encoded {len(unique_sentences):,} unique sentences out of {len(sentences):,}"
+        )
+        embeddings = embeddings[positions]
     n_vecs = len(embeddings)
     elapsed_time = time() - start
     logger.info(f"Generated {n_vecs:,} embeddings in {elapsed_time:.1f} seconds")
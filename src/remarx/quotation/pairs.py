@@ -11,25 +11,49 @@ from timeit import default_timer as time
 import numpy as np
 import numpy.typing as npt
 import polars as pl
-from voyager import Index, Space
+from voyager import Index, Space, StorageDataType
 
 from remarx.quotation.consolidate import consolidate_quotes
 from remarx.quotation.embeddings import get_cached_embeddings
 
 logger = logging.getLogger(__name__)
 
+EXACT_SEARCH_MAX_PAIRS = 25_000_000
+"Maximum number of original-reuse sentence comparisons to search exhaustively instead of with a vector index"
 
-def build_vector_index(embeddings: npt.NDArray) -> Index:
+
+def build_vector_index(
+    embeddings: npt.NDArray,
+    storage_data_type: StorageDataType = StorageDataType.Float32,
+    M: int = 12,
+    ef_construction: int = 200,
+) -> Index:
     """
-    Builds an index for a given set of embeddings with the specified
-    number of trees.
+    Builds an index for a given set of embeddings. Vectors are stored as
+    32-bit floats by default; a reduced-precision voyager storage data type
+    (`StorageDataType.Float8` or `StorageDataType.E4M3`) can be specified to
+    reduce index memory use, at some cost to match score precision.
+
+    `M` (number of connections per vector in the index graph) and
+    `ef_construction` (number of candidate neighbors considered when adding
+    vectors) are passed through to voyager and default to voyager's defaults;
+    lower values build the index faster, at some cost to search accuracy.
     """
     start = time()
     # Instantiate index using inner product / cosine similarity
     n_vecs, n_dims = embeddings.shape
-    index = Index(Space.InnerProduct, num_dimensions=n_dims, max_elements=n_vecs)
-    # more efficient to add all vectors at once
-    index.add_items(embeddings)
+    index = Index(
+        Space.InnerProduct,
+        num_dimensions=n_dims,
+        M=M,
+        ef_construction=ef_construction,
+        max_elements=n_vecs,
+        storage_data_type=storage_data_type,
+    )
+    # more efficient to add all vectors at once; voyager stores float32,
+    # so convert up front to a single contiguous float32 array
+    # (no copy if embeddings are already in that layout)
+    index.add_items(np.ascontiguousarray(embeddings, dtype=np.float32))
     # Return the index
     # NOTE: index could be saved to disk, which may be helpful in future
     elapsed_time = time() - start
@@ -39,11 +63,45 @@ def build_vector_index(embeddings: npt.NDArray) -> Index:
     return index
 
 
+def exact_nearest_neighbors(
+    original_vecs: npt.NDArray, reuse_vecs: npt.NDArray, batch_size: int = 1024
+) -> tuple[npt.NDArray, npt.NDArray]:
+    """
+    Find the nearest original vector for each reuse vector by exhaustive
+    inner product comparison. For small corpora this is faster than building
+    and querying a vector index, and the results are exact. Reuse vectors
+    are compared in batches of `batch_size`, to limit the size of the
+    intermediate similarity matrix.
+
+    Returns a tuple of arrays with the index of the nearest original vector
+    and its distance (1 - inner product, as reported by the vector index)
+    for each reuse vector, with the same types as vector index results
+    (unsigned 64-bit integer ids and 32-bit float distances).
+    """
+    original_vecs = np.asarray(original_vecs, dtype=np.float32)
+    reuse_vecs = np.asarray(reuse_vecs, dtype=np.float32)
+    # use the same id type as voyager query results, so the
+    # sentence pairs dataframe schema doesn't depend on search method
+    neighbor_ids = np.empty(len(reuse_vecs), dtype=np.uint64)
+    distances = np.empty(len(reuse_vecs), dtype=np.float32)
+    for start in range(0, len(reuse_vecs), batch_size):
+        batch = slice(start, start + batch_size)
+        similarities = reuse_vecs[batch] @ original_vecs.T
+        batch_ids = similarities.argmax(axis=1)
+        neighbor_ids[batch] = batch_ids
+        distances[batch] = 1 - similarities[np.arange(len(batch_ids)), batch_ids]
+    return neighbor_ids, distances
+
+
 def get_sentence_pairs(
     original_vecs: npt.NDArray,
     reuse_vecs: npt.NDArray,
     score_cutoff: float,
     show_progress_bar: bool = False,
+    storage_data_type: StorageDataType = StorageDataType.Float32,
+    exact_search_max_pairs: int = EXACT_SEARCH_MAX_PAIRS,
+    M: int = 12,
+    ef_construction: int = 200,
 ) -> pl.DataFrame:
     """
     Given an array of original and reuse sentence embeddings, identify pairs
@@ -54,39 +112,74 @@ def get_sentence_pairs(
     - `reuse_index`: the index of the reuse sentence
     - `match_score`: the quality of the match
 
-    Uses embeddings and a vector index to find the nearest original sentence
-    for each reuse sentence. Sentence pairs are filtered to those pairs with a match score
-    (cosine similarity) above the specified cutoff.
+    Uses embeddings to find the nearest original sentence for each reuse
+    sentence. When there are at most `exact_search_max_pairs` comparisons
+    (default `EXACT_SEARCH_MAX_PAIRS`), sentences are compared exhaustively;
+    otherwise, a vector index is used. Use 0 to always use a vector index.
+    Sentence pairs are filtered to those pairs with a match score
+    (cosine similarity) above the specified cutoff. The storage data type and
+    index parameters (`M`, `ef_construction`) are passed through to
+    [build_vector_index][remarx.quotation.pairs.build_vector_index];
+    they only take effect when a vector index is used, so they are ignored
+    for exhaustive search (set `exact_search_max_pairs=0` to force an index).
     """
-    # Build search index
-    # NOTE: An index only needs to be generated once for a set of embeddings.
-    #       Perhaps there's some potential reuse between runs?
-    start = time()
-    index = build_vector_index(original_vecs)
-    index_elapsed = time() - start
-    logger.info(
-        f"Indexed {len(original_vecs):,} sentence embeddings in {index_elapsed:.1f} seconds"
-    )
-
-    # Get sentence matches; query all vectors at once
-    # returns a list of lists with results for each reuse vector
-    start = time()
-    all_neighbor_ids, all_distances = index.query(reuse_vecs, k=1)
-    query_elapsed = time() - start
-    logger.info(
-        f"Queried {len(reuse_vecs):,} sentence embeddings in {query_elapsed:.1f} seconds"
-    )
+    n_comparisons = len(original_vecs) * len(reuse_vecs)
+    if n_comparisons <= exact_search_max_pairs:
+        # for small corpora, exact search is faster than building an index
+        logger.debug(
+            f"Using exact search for {n_comparisons:,} sentence comparisons "
+            + f"(at most {exact_search_max_pairs:,}); vector index options are not used"
+        )
+        start = time()
+        neighbor_ids, distances = exact_nearest_neighbors(original_vecs, reuse_vecs)
+        search_elapsed = time() - start
+        logger.info(
+            f"Compared {len(reuse_vecs):,} sentence embeddings to {len(original_vecs):,} "
+            + f"sentence embeddings in {search_elapsed:.1f} seconds"
+        )
+    else:
+        # Build search index
+        # NOTE: An index only needs to be generated once for a set of embeddings.
+        #       Perhaps there's some potential reuse between runs?
+        start = time()
+        index = build_vector_index(
+            original_vecs,
+            storage_data_type=storage_data_type,
+            M=M,
+            ef_construction=ef_construction,
+        )
+        index_elapsed = time() - start
+        logger.info(
+            f"Indexed {len(original_vecs):,} sentence embeddings in {index_elapsed:.1f} seconds"
+        )
 
-    result = (
-        pl.DataFrame(
-            data={"original_index": all_neighbor_ids, "match_score": all_distances}
+        # Get sentence matches; query all vectors at once
+        # returns a list of lists with results for each reuse vector;
+        # pass query vectors as a contiguous float32 array like the indexed
+        # vectors, so voyager doesn't need to convert them
+        start = time()
+        all_neighbor_ids, all_distances = index.query(
+            np.ascontiguousarray(reuse_vecs, dtype=np.float32), k=1
         )
-        # add row index
-        .with_row_index(name="reuse_index")
-        # since we requested k=1, explode the lists to get single value result
-        .explode("original_index", "match_score")
-        # then filter by specified match score cutoff
-        .filter(pl.col("match_score").lt(score_cutoff))
+        query_elapsed = time() - start
+        logger.info(
+            f"Queried {len(reuse_vecs):,} sentence embeddings in {query_elapsed:.1f} seconds"
+        )
+
+        # since we requested k=1, take the single result for each reuse vector
+        # as flat arrays, so the dataframe can be built directly from columns
+        neighbor_ids = np.asarray(all_neighbor_ids)[:, 0]
+        distances = np.asarray(all_distances)[:, 0]
+    # filter by specified match score cutoff before building the dataframe,
+    # so only matching pairs are copied into polars;
+    # reuse index is the row index of the reuse vector (same type as polars row index)
+    is_match = np.asarray(distances) < score_cutoff
+    result = pl.DataFrame(
+        data={
+            "reuse_index": np.flatnonzero(is_match).astype(np.uint32),
+            "original_index": np.asarray(neighbor_ids)[is_match],
+            "match_score": np.asarray(distances)[is_match],
+        }
     )
     total = result.height
     pluralize = "" if total == 1 else "s"
@@ -163,11 +256,14 @@ def compile_quote_pairs(
     - All other fields in order from the reuse corpus except row index
     - All other fields in order from the original corpus except row index
     """
-    # Build and return quote pairs
+    # Build and return quote pairs; use a lazy query so polars can plan
+    # both joins together and only materialize the final result
     return (
-        detected_pairs.join(reuse_corpus, on="reuse_index")
-        .join(original_corpus, on="original_index")
+        detected_pairs.lazy()
+        .join(reuse_corpus.lazy(), on="reuse_index")
+        .join(original_corpus.lazy(), on="original_index")
         .drop(["reuse_index", "original_index"])
+        .collect()
     )
 
 
@@ -179,6 +275,10 @@ def find_quote_pairs(
     consolidate: bool = True,
     show_progress_bar: bool = False,
     benchmark: bool = False,
+    storage_data_type: StorageDataType = StorageDataType.Float32,
+    exact_search_max_pairs: int = EXACT_SEARCH_MAX_PAIRS,
+    M: int = 12,
+    ef_construction: int = 200,
 ) -> None:
     """
     For a set of original sentence corpora and one reuse sentence corpus, finds
@@ -188,6 +288,14 @@ def find_quote_pairs(
     include quote pairs, and consolidation of consecutive sentences (on by default).
     When `benchmark` is enabled, summary information is logged to report
     on corpus size and timings to generate embeddings and search for pairs.
+    `exact_search_max_pairs` sets the maximum number of sentence comparisons
+    to search exhaustively instead of with a vector index (use 0 to always
+    use an index). The `storage_data_type` determines the precision of vectors
+    stored in the search index (32-bit floats by default), and `M` and
+    `ef_construction` configure how the search index is built; see
+    [build_vector_index][remarx.quotation.pairs.build_vector_index].
+    These index options only take effect when a vector index is used,
+    i.e. when there are more than `exact_search_max_pairs` comparisons.
     """
     # Load sentence data and generate embeddings
     # TODO: pass option for show_progress_bar
@@ -212,13 +320,16 @@ def find_quote_pairs(
     embeddings_seconds = time() - start
 
     # Find sentence pairs
-    # TODO: Add support for relevant voyager parameters
     start = time()
     sent_pairs = get_sentence_pairs(
         original_vecs,
         reuse_vecs,
         score_cutoff,
         show_progress_bar=show_progress_bar,  # NOTE: currently unused
+        storage_data_type=storage_data_type,
+        exact_search_max_pairs=exact_search_max_pairs,
+        M=M,
+        ef_construction=ef_construction,
     )
     query_seconds = time() - start
 
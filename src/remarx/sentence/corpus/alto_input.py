@@ -25,6 +25,10 @@ logger = logging.getLogger(__name__)
 
 ALTO_NAMESPACE_V4: str = "http://www.loc.gov/standards/alto/ns-v4#"
 
+# Regex matching words split across lines by ASCII hyphen (-), double oblique
+# hyphen (⸗), or not sign (¬, common in OCR of Fraktur) followed by newline
+re_line_end_hyphen = re.compile(r"[⸗¬-]\n")
+
 
 class AltoXmlObject(xmlmap.XmlObject):
     """
@@ -68,6 +72,9 @@ class TextBlock(AltoBlock):
     # map tag container to allow lookup of tag label by tag id
     _tags = xmlmap.NodeField("ancestor::alto:alto/alto:Tags", xmlmap.XmlObject)
 
+    tag_labels: dict[str, str] | None = None
+    "Document tag labels keyed on tag id; set by the parent AltoDocument for sorted blocks"
+
     @cached_property
     def sorted_lines(self) -> list[TextLine]:
         """
@@ -77,11 +84,12 @@ class TextBlock(AltoBlock):
         # so sort by @VPOS (may need further refinement for more complicated layouts)
         return sorted(self.lines, key=lambda line: line.vertical_position)
 
-    @property
+    @cached_property
     def text_content(self) -> str:
         """
         Text contents of this block; newline-delimited content of
         each line within this block, sorted by vertical position.
+        Cached, since block text is used for both metadata and text chunks.
         """
         return "\n".join([line.text_content for line in self.sorted_lines])
 
@@ -89,16 +97,23 @@ class TextBlock(AltoBlock):
     def tag(self) -> str | None:
         """
         Tag label; looked up based on `tag_id` in document list of tags.
-        Assumes singular tag and tag id.
+        Uses the document's tag labels when they have been set on this block;
+        otherwise, queries the document list of tags. Assumes singular tag and tag id.
+        Returns None if there is no tag id or no tag matches it.
         """
         if self.tag_id is None:
             return None
-        # return the label for the alto tag that matches the current tag id
+        # use tag labels shared from the document, if available
+        if self.tag_labels is not None:
+            return self.tag_labels.get(self.tag_id)
+        # otherwise, return the label for the alto tag that matches the current tag id
         # XPath is relative to top level alto:Tags
-        return self._tags.node.xpath(
+        labels = self._tags.node.xpath(
             f'alto:OtherTag[@ID="{self.tag_id}"]/@LABEL',
             namespaces=self.ROOT_NAMESPACES,
-        )[0]  # xpath returns a list; return first value only
+        )
+        # xpath returns a list; return first value only
+        return labels[0] if labels else None
 
 
 class AltoDocument(AltoXmlObject):
@@ -121,10 +136,25 @@ class AltoDocument(AltoXmlObject):
             and root_element.localname == "alto"
         )
 
+    @cached_property
+    def tag_labels(self) -> dict[str, str]:
+        """
+        Dictionary of tag labels keyed on tag id, from the document list of tags.
+        Built once per page and shared with sorted blocks, since block tags
+        are checked repeatedly when processing a page.
+        """
+        return {
+            tag.get("ID"): tag.get("LABEL")
+            for tag in self.node.xpath(
+                "alto:Tags/alto:OtherTag", namespaces=self.ROOT_NAMESPACES
+            )
+        }
+
     @cached_property
     def sorted_blocks(self) -> list[TextBlock]:
         """
         Returns a list of TextBlocks for this page, sorted by vertical position.
+        Sorted blocks use this document's tag labels for tag lookup.
         """
         # there's no guarantee that xml document order follows page order,
         # so sort by @VPOS (may need further refinement for more complicated layouts).
@@ -134,13 +164,17 @@ class AltoDocument(AltoXmlObject):
         # if block has no line, sort text block last
         if not self.blocks:
             return []
-        return sorted(
+        blocks = sorted(
             self.blocks,
             key=lambda block: block.vertical_position
             or (
                 block.sorted_lines[0].vertical_position if block.lines else float("inf")
             ),
         )
+        # share document tag labels, so tags don't need to be queried per block
+        for block in blocks:
+            block.tag_labels = self.tag_labels
+        return blocks
 
     def text_chunks(self, include: set[str] | None = None) -> Generator[dict[str, str]]:
         """
@@ -213,10 +247,13 @@ class ALTOInput(FileInput):
                 # get base filename for logging and file name in metadata
                 base_filename = pathlib.Path(zip_filepath).name
                 num_valid_files += 1
-                # report total # blocks, lines for each file as processed
-                logger.debug(
-                    f"{base_filename}: {len(alto_xmlobj.blocks)} blocks, {len(alto_xmlobj.lines)} lines"
-                )
+                # report total # blocks, lines for each file as processed;
+                # only when debug logging is enabled, since counting requires
+                # additional xpath queries over the full document
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(
+                        f"{base_filename}: {len(alto_xmlobj.blocks)} blocks, {len(alto_xmlobj.lines)} lines"
+                    )
                 # clear page number from current metadata if set
                 with contextlib.suppress(KeyError):
                     del self.current_metadata["page_number"]
@@ -240,10 +277,14 @@ class ALTOInput(FileInput):
                         # set flag that metadata has been collected
                         collected_metadata = True
 
-                    block_text = block.text_content
-                    # Clean up hyphenated line breaks from ALTO physical layout
-                    # Rejoin words split by ASCII hyphen (-) or double oblique hyphen (⸗) followed by newline
-                    block_text = re.sub(r"[⸗-]\n", "", block_text)
+                    # Apply section filtering before any text cleanup,
+                    # so excluded blocks are not processed further
+                    if include_sections is not None and section not in include_sections:
+                        continue
+
+                    # Clean up hyphenated line breaks from ALTO physical layout;
+                    # rejoin words split across lines
+                    block_text = re_line_end_hyphen.sub("", block.text_content)
                     chunk = {
                         "text": block_text,
                         "section_type": section,
@@ -252,10 +293,6 @@ class ALTOInput(FileInput):
                         "page_file": base_filename,
                     } | self.current_metadata
 
-                    # Apply section filtering up front
-                    if include_sections is not None and section not in include_sections:
-                        continue
-
                     # Collect footnotes and yield after all body text
                     if section == "footnote":
                         footnote_chunks.append(chunk)
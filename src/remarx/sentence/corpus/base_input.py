@@ -16,6 +16,7 @@ they are found as available input classes.
 
 """
 
+import itertools
 import logging
 import pathlib
 import re
@@ -25,7 +26,7 @@ from enum import StrEnum
 from functools import cached_property
 from typing import Any, ClassVar, Self
 
-from remarx.sentence.segment import segment_text
+from remarx.sentence.segment import segment_texts
 
 logger = logging.getLogger(__name__)
 
@@ -71,6 +72,8 @@ class FileInput:
             return False
 
         # Keep the sentence only if the number of resulting tokens is >= min_words
+        # NOTE: get_sentences applies the same word count rule to skip whole
+        # text chunks before segmentation; keep the two checks consistent
         return len(sentence.split()) >= self.min_words
 
     def get_text(self) -> Generator[dict[str, str]]:
@@ -107,11 +110,29 @@ class FileInput:
         # zero-based sentence index for this file, across all chunks
         sentence_index = 0
         omitted_count = 0
-        for chunk_info in self.get_text():
+        skipped_chunk_count = 0
+
+        def segmentable_chunks() -> Generator[dict[str, Any]]:
             # each chunk of text is a dictionary that at minimum
-            # contains text for that chunk; it may include other metadata
-            chunk_text = chunk_info["text"]
-            for _char_idx, sentence in segment_text(chunk_text):
+            # contains text for that chunk; it may include other metadata.
+            # Skip chunks with fewer than min_words words (same rule as
+            # include_sentence), since no sentence within them could be
+            # included; this avoids segmenting them at all.
+            nonlocal skipped_chunk_count
+            for chunk in self.get_text():
+                num_words = len(chunk["text"].split())
+                if num_words >= self.min_words:
+                    yield chunk
+                # count skipped chunks with any text (empty chunks have no sentences)
+                elif num_words:
+                    skipped_chunk_count += 1
+
+        # Chunk texts are segmented in batches, so tee the chunks to pair
+        # each one with its segmented sentences
+        chunks, text_chunks = itertools.tee(segmentable_chunks())
+        segmented_chunks = segment_texts(chunk["text"] for chunk in text_chunks)
+        for chunk_info, chunk_sentences in zip(chunks, segmented_chunks, strict=True):
+            for _char_idx, sentence in chunk_sentences:
                 # Filter out invalid sentences (short or punctuation-only)
                 if not self.include_sentence(sentence):
                     omitted_count += 1
@@ -144,6 +165,13 @@ class FileInput:
                 omitted_count,
                 self.file_name,
             )
+        if skipped_chunk_count:
+            logger.info(
+                "Omitted %d short text chunks (fewer than %d words) from %s",
+                skipped_chunk_count,
+                self.min_words,
+                self.file_name,
+            )
 
     @classmethod
     def subclasses(cls) -> list[type[Self]]:
@@ -7,6 +7,7 @@ from the TEI.
 import logging
 import pathlib
 import re
+from bisect import bisect_right
 from collections import namedtuple
 from collections.abc import Generator
 from dataclasses import dataclass, field
@@ -55,6 +56,29 @@ def normalize_whitespace(text: str) -> str:
     return re_normalize_whitespace.sub(" ", text)
 
 
+def split_offsets[T](value_by_offset: dict[int, T]) -> tuple[list[int], list[T]]:
+    """
+    Split a dictionary of values keyed on ascending character offsets
+    into parallel lists of offsets and values, for lookup with
+    [value_at_offset][remarx.sentence.corpus.tei_input.value_at_offset].
+    """
+    return list(value_by_offset.keys()), list(value_by_offset.values())
+
+
+def value_at_offset[T](
+    offset_values: tuple[list[int], list[T]], char_index: int
+) -> T | None:
+    """
+    Return the value for the last offset at or before `char_index`,
+    using binary search over offset and value lists as returned by
+    [split_offsets][remarx.sentence.corpus.tei_input.split_offsets].
+    Returns None if there is no offset at or before `char_index`.
+    """
+    offsets, values = offset_values
+    position = bisect_right(offsets, char_index)
+    return values[position - 1] if position else None
+
+
 class TEIParagraph(BaseTEIXmlObject):
     """
     Custom :class:`neuxml.xmlmap.XmlObject` instance for a paragraph
@@ -81,6 +105,11 @@ class TEIParagraph(BaseTEIXmlObject):
         text_contents: list[str] = []
         self.line_number_by_offset: dict[int, int] = {}
         self.page_begin_offset: dict[int, str] = {}
+        # track line numbers already recorded, for fast membership checks
+        seen_line_numbers: set[int] = set()
+        # check once whether this paragraph crosses a page boundary,
+        # rather than running the xpath for every text node
+        continuing_page = self.continuing_page
         char_offset = 0
 
         for el in self.text_nodes:
@@ -112,11 +141,9 @@ class TEIParagraph(BaseTEIXmlObject):
             if line_begin is not None:
                 line_number = int(line_begin.get("n")) if line_begin.get("n") else None
                 # record character offset when line begin tag first encountered
-                if (
-                    line_number
-                    and line_number not in self.line_number_by_offset.values()
-                ):
+                if line_number and line_number not in seen_line_numbers:
                     self.line_number_by_offset[char_offset] = line_number
+                    seen_line_numbers.add(line_number)
 
                     # ensure text separated by <lb\> has whitespace
                     # if there is a preceding text segment and it does not end
@@ -126,7 +153,7 @@ class TEIParagraph(BaseTEIXmlObject):
 
             # if this paragraph wraps a page boundary, check for page begin
             # and store character offset
-            if self.continuing_page:
+            if continuing_page:
                 page_begin = None
                 # look for parent of tail text or previous sibling of
                 # line break previously identified
@@ -242,11 +269,16 @@ class TEIinput(FileInput):
             text = text_block.get_text()
             if text:
                 # store the line number offsets on the input class, since
-                # xmlobject nodelist does NOT preserve non-xml object modifications
-                self.text_line_numbers[i] = text_block.line_number_by_offset
+                # xmlobject nodelist does NOT preserve non-xml object modifications;
+                # split once into offset and value lists for binary search by sentence
+                self.text_line_numbers[i] = split_offsets(
+                    text_block.line_number_by_offset
+                )
                 # for continuing pages, store offset of new page number
                 if text_block.page_begin_offset:
-                    self.continuing_page_numbers[i] = text_block.page_begin_offset
+                    self.continuing_page_numbers[i] = split_offsets(
+                        text_block.page_begin_offset
+                    )
 
                 yield {
                     "text": text,
@@ -291,14 +323,7 @@ class TEIinput(FileInput):
         line number offsets must be populated by get_text().
         Returns None if line number cannot be determined.
         """
-        line_number_by_offset = self.text_line_numbers[text_index]
-
-        line_number = None
-        for offset, ln in line_number_by_offset.items():
-            if offset > char_index:
-                break
-            line_number = ln
-        return line_number
+        return value_at_offset(self.text_line_numbers[text_index], char_index)
 
     def get_extra_metadata(
         self, chunk_info: dict[str, Any], char_idx: int, sentence: str
@@ -322,11 +347,7 @@ class TEIinput(FileInput):
 
             # check for continuing page number
             if i in self.continuing_page_numbers:
-                page_number = None
-                for offset, page in self.continuing_page_numbers[i].items():
-                    if offset > char_idx:
-                        break
-                    page_number = page
+                page_number = value_at_offset(self.continuing_page_numbers[i], char_idx)
                 # if found, override page number
                 if page_number is not None:
                     extra_info["page_number"] = page_number
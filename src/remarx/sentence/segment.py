@@ -5,13 +5,32 @@ sentence begins and the sentence text itself.
 """
 
 import logging
+from collections.abc import Generator, Iterable
+from functools import cache
 
 import spacy
 from spacy.cli import download
+from spacy.language import Language
 
 logger = logging.getLogger(__name__)
 
 
+@cache
+def load_pipeline(model: str) -> Language:
+    """
+    Load the specified spaCy pipeline. Automatically downloads the spaCy model
+    if it is not installed. Loaded pipelines are cached by name, so the model
+    is only loaded once per session even when multiple inputs are segmented.
+    """
+    try:
+        return spacy.load(model)
+    except OSError:
+        # If the model is not pre-installed, download and retry
+        logger.info(f"Downloading spaCy model: '{model}'")
+        download(model)
+        return spacy.load(model)
+
+
 def segment_text(text: str, model: str = "de_core_news_sm") -> list[tuple[int, str]]:
     """
     Segment a string of text into sentences with character indices.
@@ -22,15 +41,27 @@ def segment_text(text: str, model: str = "de_core_news_sm") -> list[tuple[int, s
     :param model: spaCy model name, defaulted to "de_core_news_sm"
     :return: List of tuples where each tuple contains (start_char_index, sentence_text)
     """
-
-    try:
-        nlp = spacy.load(model)
-    except OSError:
-        # If the model is not pre-installed, download and retry
-        logger.info(f"Downloading spaCy model: '{model}'")
-        download(model)
-        nlp = spacy.load(model)
-
+    nlp = load_pipeline(model)
     doc = nlp(text)
 
     return [(sent.start_char, sent.text) for sent in doc.sents]
+
+
+def segment_texts(
+    texts: Iterable[str], model: str = "de_core_news_sm", batch_size: int = 256
+) -> Generator[list[tuple[int, str]]]:
+    """
+    Segment multiple strings of text into sentences with character indices.
+    The spaCy model is loaded once and texts are processed in batches, which
+    is much faster than calling [segment_text][remarx.sentence.segment.segment_text]
+    for each text in a long sequence of short texts (e.g., paragraphs or text blocks).
+
+    :param texts: Iterable of input texts to be segmented into sentences
+    :param model: spaCy model name, defaulted to "de_core_news_sm"
+    :param batch_size: Number of texts to process in each batch
+    :return: Generator with one list of (start_char_index, sentence_text) tuples
+        per input text, in input order
+    """
+    nlp = load_pipeline(model)
+    for doc in nlp.pipe(texts, batch_size=batch_size):
+        yield [(sent.start_char, sent.text) for sent in doc.sents]
@@ -7,6 +7,7 @@ from types import SimpleNamespace
 from unittest.mock import Mock, patch
 
 import marimo
+import polars as pl
 import pytest
 from marimo._server.asgi import ASGIAppBuilder
 
@@ -22,6 +23,7 @@ from remarx.app.utils import (
     launch_app,
     lifespan,
     redirect_root,
+    render_corpus_summaries,
     summarize_corpus_selection,
 )
 from remarx.utils import CorpusPath
@@ -198,6 +200,27 @@ def test_summarize_corpus_selection_without_sections(tmp_path):
     assert summary["footnote sentences"] == 0
 
 
+def test_summarize_corpus_selection_cached(tmp_path):
+    csv_path = tmp_path / "cached.csv"
+    csv_path.write_text("sent_id,text\n1,foo\n2,bar\n")
+    os.utime(csv_path, (1_000_000_000, 1_000_000_000))
+
+    with patch("remarx.app.utils.pl.scan_csv", wraps=pl.scan_csv) as mock_scan:
+        summary = summarize_corpus_selection(csv_path)
+        assert summary["total sentences"] == 2
+        # modifying the returned summary does not affect the cached version
+        summary["total sentences"] = 100
+        # unchanged file is summarized from cache
+        assert summarize_corpus_selection(csv_path)["total sentences"] == 2
+        assert mock_scan.call_count == 1
+
+        # updated file is summarized again
+        csv_path.write_text("sent_id,text\n1,foo\n2,bar\n3,baz\n")
+        os.utime(csv_path, (1_000_000_100, 1_000_000_100))
+        assert summarize_corpus_selection(csv_path)["total sentences"] == 3
+        assert mock_scan.call_count == 2
+
+
 def test_summarize_corpus_selection_invalid_path(tmp_path):
     missing = tmp_path / "missing.csv"
     assert summarize_corpus_selection(SimpleNamespace(path=missing)) is None
@@ -207,6 +230,31 @@ def test_summarize_corpus_selection_none_path():
     assert summarize_corpus_selection(SimpleNamespace(path=None)) is None
 
 
+@patch("remarx.app.utils.mo")
+def test_render_corpus_summaries(mock_mo, tmp_path):
+    csv_path = tmp_path / "corpus.csv"
+    csv_path.write_text("sent_id,text\n1,foo\n")
+    missing = tmp_path / "missing.csv"
+
+    # unsummarizable selections are skipped; table includes valid ones
+    result = render_corpus_summaries(
+        [csv_path, SimpleNamespace(path=missing)], "Selected Corpora", "None yet."
+    )
+    assert result == mock_mo.vstack.return_value
+    mock_mo.md.assert_called_once_with("#### Selected Corpora")
+    table_args, table_kwargs = mock_mo.ui.table.call_args
+    assert [summary["filename"] for summary in table_args[0]] == ["corpus.csv"]
+    assert table_kwargs["page_size"] == 1
+    mock_mo.callout.assert_not_called()
+
+    # no valid selections: info callout with empty message
+    mock_mo.reset_mock()
+    result = render_corpus_summaries([missing], "Selected Corpora", "None yet.")
+    assert result == mock_mo.callout.return_value
+    mock_mo.callout.assert_called_once_with("None yet.", kind="info")
+    mock_mo.ui.table.assert_not_called()
+
+
 def test_get_current_log_file(tmp_path):
     logger = logging.getLogger()
     original_handlers = logger.handlers[:]
@@ -9,14 +9,40 @@ import time
 from unittest.mock import Mock, patch
 
 import numpy as np
+import pytest
 
 from remarx.quotation.embeddings import (
     DEFAULT_MODEL,
     get_cached_embeddings,
     get_sentence_embeddings,
+    load_model,
 )
 
 
+@pytest.fixture(autouse=True)
+def clear_model_cache():
+    # ensure cached models don't leak between tests
+    load_model.cache_clear()
+    yield
+    load_model.cache_clear()
+
+
+@patch("remarx.quotation.embeddings.SentenceTransformer")
+def test_load_model(mock_transformer_class):
+    model = load_model(DEFAULT_MODEL)
+    assert model == mock_transformer_class.return_value
+    mock_transformer_class.assert_called_once_with(DEFAULT_MODEL)
+
+    # subsequent calls for the same model reuse the loaded model
+    assert load_model(DEFAULT_MODEL) is model
+    mock_transformer_class.assert_called_once()
+
+    # a different model is loaded separately
+    load_model("alt-model")
+    mock_transformer_class.assert_called_with("alt-model")
+    assert mock_transformer_class.call_count == 2
+
+
 @patch("remarx.quotation.embeddings.SentenceTransformer")
 def test_get_sentence_embeddings(mock_transformer_class, caplog):
     """Test sentence embedding generation from list of sentences."""
@@ -68,6 +94,24 @@ def test_get_sentence_embeddings(mock_transformer_class, caplog):
     assert result == mock_embeddings
 
 
+@patch("remarx.quotation.embeddings.SentenceTransformer")
+def test_get_sentence_embeddings_duplicates(mock_transformer_class):
+    mock_model = mock_transformer_class.return_value
+    mock_model.encode.return_value = np.array([[1, 0], [0, 1]])
+
+    sentences = ["Kopfzeile", "Erster Satz", "Kopfzeile"]
+    result = get_sentence_embeddings(sentences)
+
+    # duplicate sentences are only encoded once, in order of first occurrence
+    mock_model.encode.assert_called_once_with(
+        ["Kopfzeile", "Erster Satz"],
+        normalize_embeddings=True,
+        show_progress_bar=False,
+    )
+    # result still has one embedding per input sentence
+    np.testing.assert_array_equal(result, np.array([[1, 0], [0, 1], [1, 0]]))
+
+
 @patch("remarx.quotation.embeddings.np")
 @patch("remarx.quotation.embeddings.get_sentence_embeddings")
 def test_get_cached_embeddings(mock_get_sent_embeddings, mock_np, tmp_path):
@@ -86,11 +130,14 @@ def test_get_cached_embeddings(mock_get_sent_embeddings, mock_np, tmp_path):
     mock_get_sent_embeddings.assert_called_once_with(
         sentences, model_name=DEFAULT_MODEL, show_progress_bar=False
     )
-    # np.save called once with cache file handle and embeddings
+    # np.save called once with cache file handle and float32 embeddings
     save_args, save_kwargs = mock_np.save.call_args
     assert isinstance(save_args[0], io.BufferedWriter)
-    assert save_args[1] == mock_get_sent_embeddings.return_value
-    assert save_kwargs["allow_pickle"]
+    mock_get_sent_embeddings.return_value.astype.assert_called_once_with(
+        mock_np.float32, copy=False
+    )
+    assert save_args[1] == mock_get_sent_embeddings.return_value.astype.return_value
+    assert not save_kwargs["allow_pickle"]
 
     # cache file exists but is zero size
     mock_get_sent_embeddings.reset_mock()
@@ -105,17 +152,30 @@ def test_get_cached_embeddings(mock_get_sent_embeddings, mock_np, tmp_path):
     mock_get_sent_embeddings.reset_mock()
     mock_np.reset_mock()
     expected_cachefile.write_text("test")
+    # one cached embedding per sentence
+    mock_np.load.return_value = [[0.1], [0.2]]
     embed, from_cache = get_cached_embeddings(source_file, sentences)
     assert from_cache
     mock_get_sent_embeddings.assert_not_called()
     # embeddings loaded from file and returned
     mock_np.load.assert_called_once()
     assert embed == mock_np.load.return_value
-    load_args, _load_kwargs = mock_np.load.call_args
-    assert isinstance(load_args[0], io.BufferedReader)
+    # cache file is loaded as a read-only memory map
+    mock_np.load.assert_called_once_with(expected_cachefile, mmap_mode="r")
     # save not called
     mock_np.save.assert_not_called()
 
+    # cache file is newer but number of embeddings doesn't match sentences
+    mock_np.reset_mock()
+    mock_np.load.return_value = [[0.1], [0.2], [0.3]]
+    embed, from_cache = get_cached_embeddings(source_file, sentences)
+    assert not from_cache
+    mock_np.load.assert_called_once()
+    mock_get_sent_embeddings.assert_called_once_with(
+        sentences, model_name=DEFAULT_MODEL, show_progress_bar=False
+    )
+    mock_np.save.assert_called_once()
+
     # cache file exists but source file is newer
     mock_get_sent_embeddings.reset_mock()
     mock_np.reset_mock()
@@ -155,7 +215,7 @@ def test_get_cached_embeddings_np_integration(mock_get_sent_embeddings, tmp_path
     # create source file
     source_file = tmp_path / "input.csv"
     source_file.touch()
-    sentences = ["one", "two"]
+    sentences = ["one", "two", "three"]
     # cache file named based on source file and model
     expected_cachefile = tmp_path / f"input_{DEFAULT_MODEL}.npy"
     # return sample vector data
@@ -171,6 +231,8 @@ def test_get_cached_embeddings_np_integration(mock_get_sent_embeddings, tmp_path
     with expected_cachefile.open("rb") as cache_filehandle:
         saved_vecs = np.load(cache_filehandle)
     assert np.array_equal(saved_vecs, sample_vecs)
+    # saved as float32
+    assert saved_vecs.dtype == np.float32
 
     # ensure cache file timestamp is newer than source file
     time.sleep(0.1)
@@ -180,3 +242,5 @@ def test_get_cached_embeddings_np_integration(mock_get_sent_embeddings, tmp_path
     embed, from_cache = get_cached_embeddings(source_file, sentences)
     assert from_cache
     assert np.array_equal(embed, sample_vecs)
+    # cached embeddings are memory-mapped
+    assert isinstance(embed, np.memmap)
@@ -8,11 +8,13 @@ import numpy as np
 import polars as pl
 import pytest
 from polars.testing import assert_frame_equal
-from voyager import Index, Space
+from voyager import Index, Space, StorageDataType
 
 from remarx.quotation.pairs import (
+    EXACT_SEARCH_MAX_PAIRS,
     build_vector_index,
     compile_quote_pairs,
+    exact_nearest_neighbors,
     find_quote_pairs,
     get_sentence_pairs,
     load_sent_corpus,
@@ -30,7 +32,12 @@ def test_build_vector_index(mock_index_class, caplog):
     result = build_vector_index(test_embeddings)
     assert result is mock_index
     mock_index_class.assert_called_once_with(
-        Space.InnerProduct, num_dimensions=50, max_elements=10
+        Space.InnerProduct,
+        num_dimensions=50,
+        M=12,
+        ef_construction=200,
+        max_elements=10,
+        storage_data_type=StorageDataType.Float32,
     )
     assert mock_index.add_items.call_count == 1
 
@@ -38,6 +45,33 @@ def test_build_vector_index(mock_index_class, caplog):
     # get args and check for expected match
     args, _kwargs = mock_index.add_items.call_args
     assert np.array_equal(args[0], test_embeddings)
+    # vectors are added as a contiguous float32 array
+    assert args[0].dtype == np.float32
+    assert args[0].flags["C_CONTIGUOUS"]
+
+    # Reduced precision storage
+    mock_index_class.reset_mock()
+    build_vector_index(test_embeddings, storage_data_type=StorageDataType.E4M3)
+    mock_index_class.assert_called_once_with(
+        Space.InnerProduct,
+        num_dimensions=50,
+        M=12,
+        ef_construction=200,
+        max_elements=10,
+        storage_data_type=StorageDataType.E4M3,
+    )
+
+    # Custom index graph parameters
+    mock_index_class.reset_mock()
+    build_vector_index(test_embeddings, M=8, ef_construction=64)
+    mock_index_class.assert_called_once_with(
+        Space.InnerProduct,
+        num_dimensions=50,
+        M=8,
+        ef_construction=64,
+        max_elements=10,
+        storage_data_type=StorageDataType.Float32,
+    )
 
     # Check logging
     caplog.clear()
@@ -49,6 +83,109 @@ def test_build_vector_index(mock_index_class, caplog):
     assert re.fullmatch(expected_msg, caplog.record_tuples[0][2])
 
 
+def test_exact_nearest_neighbors():
+    original_vecs = np.array([[1, 0], [0, 1], [0.6, 0.8]])
+    reuse_vecs = np.array([[0.8, 0.6], [0, 1], [-1, 0]])
+    neighbor_ids, distances = exact_nearest_neighbors(original_vecs, reuse_vecs)
+    np.testing.assert_array_equal(neighbor_ids, [2, 1, 1])
+    # distance is 1 - inner product, as reported by the vector index
+    np.testing.assert_allclose(distances, [0.04, 0, 1], atol=1e-6)
+    # same types as vector index query results
+    assert neighbor_ids.dtype == np.uint64
+    assert distances.dtype == np.float32
+
+    # same results when reuse vectors are compared in smaller batches
+    batch_ids, batch_distances = exact_nearest_neighbors(
+        original_vecs, reuse_vecs, batch_size=2
+    )
+    np.testing.assert_array_equal(batch_ids, neighbor_ids)
+    np.testing.assert_array_equal(batch_distances, distances)
+
+
+def test_exact_nearest_neighbors_matches_index():
+    # exact search should agree with the vector index
+    rng = np.random.default_rng(1234)
+    original_vecs = rng.normal(size=(200, 16)).astype(np.float32)
+    original_vecs /= np.linalg.norm(original_vecs, axis=1, keepdims=True)
+    reuse_vecs = original_vecs[::10] + rng.normal(scale=0.05, size=(20, 16))
+    reuse_vecs /= np.linalg.norm(reuse_vecs, axis=1, keepdims=True)
+
+    neighbor_ids, distances = exact_nearest_neighbors(original_vecs, reuse_vecs)
+    index_ids, index_distances = build_vector_index(original_vecs).query(
+        reuse_vecs, k=1
+    )
+    np.testing.assert_array_equal(neighbor_ids, index_ids[:, 0])
+    np.testing.assert_allclose(distances, index_distances[:, 0], atol=1e-5)
+    assert neighbor_ids.dtype == index_ids.dtype
+    assert distances.dtype == index_distances.dtype
+
+
+@patch("remarx.quotation.pairs.exact_nearest_neighbors")
+@patch("remarx.quotation.pairs.build_vector_index")
+def test_get_sentence_pairs_exact(mock_build_index, mock_exact_search, caplog):
+    mock_exact_search.return_value = (
+        np.array([0, 5, 1], dtype=np.uint64),
+        np.array([0.7, 0.4, 0.18], dtype=np.float32),
+    )
+    original_vecs = np.array([[5], [10]])
+    reuse_vecs = np.array([[0], [1], [2]])
+
+    # small corpora use exact search rather than an index
+    with caplog.at_level(logging.INFO):
+        results = get_sentence_pairs(original_vecs, reuse_vecs, 0.2)
+    mock_build_index.assert_not_called()
+    mock_exact_search.assert_called_once_with(original_vecs, reuse_vecs)
+    expected = pl.DataFrame(
+        [{"reuse_index": 2, "original_index": 1, "match_score": 0.18}]
+    ).cast(
+        {
+            "reuse_index": pl.UInt32,
+            "original_index": pl.UInt64,
+            "match_score": pl.Float32,
+        }
+    )
+    # dtypes match vector index results
+    assert_frame_equal(results, expected)
+
+    log_messages = [log[2] for log in caplog.record_tuples]
+    assert any(
+        re.fullmatch(
+            r"Compared 3 sentence embeddings to 2 sentence embeddings in \d+\.\d seconds",
+            log,
+        )
+        for log in log_messages
+    )
+
+    # debug logging notes that vector index options are not used
+    caplog.clear()
+    with caplog.at_level(logging.DEBUG, logger="remarx.quotation.pairs"):
+        get_sentence_pairs(original_vecs, reuse_vecs, 0.2)
+    assert (
+        "Using exact search for 6 sentence comparisons (at most 25,000,000); "
+        + "vector index options are not used"
+    ) in [log[2] for log in caplog.record_tuples]
+
+
+def test_get_sentence_pairs_exact_schema():
+    # exact search and vector index search return the same dataframe schema
+    rng = np.random.default_rng(1234)
+    original_vecs = rng.normal(size=(50, 8)).astype(np.float32)
+    original_vecs /= np.linalg.norm(original_vecs, axis=1, keepdims=True)
+    reuse_vecs = original_vecs[::5]
+
+    exact_results = get_sentence_pairs(original_vecs, reuse_vecs, 0.2)
+    index_results = get_sentence_pairs(
+        original_vecs, reuse_vecs, 0.2, exact_search_max_pairs=0
+    )
+    assert exact_results.schema == index_results.schema
+    assert exact_results.schema == {
+        "reuse_index": pl.UInt32,
+        "original_index": pl.UInt64,
+        "match_score": pl.Float32,
+    }
+    assert_frame_equal(exact_results, index_results, check_exact=False, abs_tol=1e-5)
+
+
 @patch("remarx.quotation.pairs.get_cached_embeddings")
 @patch("remarx.quotation.pairs.build_vector_index")
 def test_get_sentence_pairs(mock_build_index, mock_embeddings, caplog):
@@ -67,22 +204,35 @@ def test_get_sentence_pairs(mock_build_index, mock_embeddings, caplog):
     expected = pl.DataFrame(
         [{"reuse_index": 2, "original_index": 1, "match_score": 0.18}]
     ).cast({"reuse_index": pl.UInt32})  # cast to match row index type
-    results = get_sentence_pairs(original_vecs, reuse_vecs, 0.2)
+    # disable exact search to test vector index search
+    results = get_sentence_pairs(
+        original_vecs, reuse_vecs, 0.2, exact_search_max_pairs=0
+    )
     assert_frame_equal(results, expected)
 
     ## check mock calls
     # - embeddings is no longer called by this method
     assert mock_embeddings.call_count == 0
     # - index created with original vectors
-    mock_build_index.assert_called_once_with(original_vecs)
+    mock_build_index.assert_called_once_with(
+        original_vecs,
+        storage_data_type=StorageDataType.Float32,
+        M=12,
+        ef_construction=200,
+    )
     # - query called with reuse vectors
     assert mock_index.query.call_count == 1
-    mock_index.query.assert_called_with(reuse_vecs, k=1)
+    query_vecs = mock_index.query.call_args.args[0]
+    assert np.array_equal(query_vecs, reuse_vecs)
+    # - query vectors are passed as a contiguous float32 array
+    assert query_vecs.dtype == np.float32
+    assert query_vecs.flags.c_contiguous
+    assert mock_index.query.call_args.kwargs == {"k": 1}
 
     # Case: Check logging
     caplog.clear()
     with caplog.at_level(logging.INFO):
-        get_sentence_pairs(original_vecs, reuse_vecs, 0.2)
+        get_sentence_pairs(original_vecs, reuse_vecs, 0.2, exact_search_max_pairs=0)
 
     # check log messages for expected messages (order agnostic)
     log_messages = [log[2] for log in caplog.record_tuples]
@@ -251,7 +401,13 @@ def test_find_quote_pairs(
     np.testing.assert_array_equal(mock_sent_pairs.call_args.args[0], orig_vecs)
     np.testing.assert_array_equal(mock_sent_pairs.call_args.args[1], reuse_vecs)
     assert mock_sent_pairs.call_args.args[2] == 0.225
-    assert mock_sent_pairs.call_args.kwargs == {"show_progress_bar": False}
+    assert mock_sent_pairs.call_args.kwargs == {
+        "show_progress_bar": False,
+        "storage_data_type": StorageDataType.Float32,
+        "exact_search_max_pairs": EXACT_SEARCH_MAX_PAIRS,
+        "M": 12,
+        "ef_construction": 200,
+    }
 
     mock_compile_pairs.assert_called_once_with(orig_df, reuse_df, ["sent_pairs"])
     mock_consolidate_quotes.assert_not_called()
@@ -291,7 +447,44 @@ def test_find_quote_pairs(
         ["original"], "reuse", out_csv, show_progress_bar=True, consolidate=False
     )
     # check mocks call kwargs
-    assert mock_sent_pairs.call_args.kwargs == {"show_progress_bar": True}
+    assert mock_sent_pairs.call_args.kwargs == {
+        "show_progress_bar": True,
+        "storage_data_type": StorageDataType.Float32,
+        "exact_search_max_pairs": EXACT_SEARCH_MAX_PAIRS,
+        "M": 12,
+        "ef_construction": 200,
+    }
+
+    # Case: reduced precision index storage
+    mock_load_corpus.side_effect = [(orig_df, orig_vecs), (reuse_df, reuse_vecs)]
+    mock_sent_pairs.reset_mock()
+    find_quote_pairs(
+        ["original"],
+        "reuse",
+        out_csv,
+        consolidate=False,
+        storage_data_type=StorageDataType.Float8,
+    )
+    assert (
+        mock_sent_pairs.call_args.kwargs["storage_data_type"] == StorageDataType.Float8
+    )
+
+    # Case: custom exact search limit
+    mock_load_corpus.side_effect = [(orig_df, orig_vecs), (reuse_df, reuse_vecs)]
+    mock_sent_pairs.reset_mock()
+    find_quote_pairs(
+        ["original"], "reuse", out_csv, consolidate=False, exact_search_max_pairs=0
+    )
+    assert mock_sent_pairs.call_args.kwargs["exact_search_max_pairs"] == 0
+
+    # Case: custom index parameters
+    mock_load_corpus.side_effect = [(orig_df, orig_vecs), (reuse_df, reuse_vecs)]
+    mock_sent_pairs.reset_mock()
+    find_quote_pairs(
+        ["original"], "reuse", out_csv, consolidate=False, M=8, ef_construction=64
+    )
+    assert mock_sent_pairs.call_args.kwargs["M"] == 8
+    assert mock_sent_pairs.call_args.kwargs["ef_construction"] == 64
 
     # Case no results
     mock_load_corpus.side_effect = [(orig_df, orig_vecs), (reuse_df, reuse_vecs)]
@@ -130,6 +130,12 @@ def test_alto_textblock():
     assert altoxml.blocks[0].tag_id == "BT252"
     assert altoxml.blocks[0].tag == "page number"
 
+    # blocks not accessed via sorted blocks query the document list of tags
+    assert alto_textblock.tag_labels is None
+    # unknown tag id
+    alto_textblock.tag_id = "unknown"
+    assert alto_textblock.tag is None
+
     # handles no tag id
     # attribute is present but has no content
     alto_textblock.tag_id = None
@@ -139,6 +145,29 @@ def test_alto_textblock():
     assert alto_textblock.tag is None
 
 
+def test_alto_document_tag_labels():
+    altoxml = xmlmap.load_xmlobject_from_file(FIXTURE_ALTO_PAGE, AltoDocument)
+    # tag labels are read from the document list of tags
+    assert altoxml.tag_labels["BT251"] == "Header"
+    assert altoxml.tag_labels["BT252"] == "page number"
+
+    # sorted blocks share the document tag labels
+    assert all(
+        block.tag_labels is altoxml.tag_labels for block in altoxml.sorted_blocks
+    )
+    # tags match the document list of tags lookup
+    for sorted_block, block in zip(
+        altoxml.sorted_blocks,
+        sorted(altoxml.blocks, key=lambda block: block.vertical_position),
+        strict=True,
+    ):
+        assert sorted_block.tag == block.tag
+    # unknown tag id
+    block = altoxml.sorted_blocks[0]
+    block.tag_id = "unknown"
+    assert block.tag is None
+
+
 def test_alto_textblock_sorted_lines():
     altoxml = xmlmap.load_xmlobject_from_file(FIXTURE_ALTO_PAGE, AltoDocument)
     # the third text block has the most lines;
@@ -240,6 +269,21 @@ def test_altoinput_get_text(caplog):
         # empty file now considered invalid
         f"Processed {FIXTURE_ALTO_ZIPFILE.name} with 7 files (6 valid ALTO)"
     )
+    # block and line counts are only reported when debug logging is enabled
+    assert not any("blocks, " in record.getMessage() for record in caplog.records)
+
+
+def test_altoinput_get_text_debug_counts(caplog):
+    caplog.set_level(logging.DEBUG, logger="remarx.sentence.corpus.alto_input")
+    alto_input = ALTOInput(input_file=FIXTURE_ALTO_ZIPFILE)
+    list(alto_input.get_text())
+    debug_messages = [
+        record.getMessage() for record in caplog.records if record.levelname == "DEBUG"
+    ]
+    assert any(
+        msg.startswith("1896-97a.pdf_page_1.xml: ") and msg.endswith(" lines")
+        for msg in debug_messages
+    )
 
 
 def test_altoinput_get_text_filtered(caplog):
@@ -494,10 +538,24 @@ def test_alto_text_cleaning():
     )
 
 
-@patch("remarx.sentence.corpus.base_input.segment_text")
-def test_get_sentences_sequential(mock_segment_text: Mock):
+def test_alto_text_cleaning_not_sign(tmp_path: pathlib.Path):
+    """Test that words split with a not sign (¬) at line end are rejoined."""
+    archive_path = tmp_path / "alto_not_sign.zip"
+    page_xml = FIXTURE_ALTO_PAGE.read_text(encoding="utf-8").replace("Salon⸗", "Salon¬")
+    with ZipFile(archive_path, "w") as archive:
+        archive.writestr("page1.xml", page_xml)
+
+    alto_input = ALTOInput(input_file=archive_path, filter_sections=False)
+    chunk_texts = [chunk["text"] for chunk in alto_input.get_text()]
+
+    assert not any("Salon¬\nkritiken" in text for text in chunk_texts)
+    assert any("Salonkritiken" in text for text in chunk_texts)
+
+
+@patch("remarx.sentence.corpus.base_input.segment_texts")
+def test_get_sentences_sequential(mock_segment_texts: Mock):
     # patch in simple segmenter to split each input text in two
-    mock_segment_text.side_effect = simple_segmenter
+    mock_segment_texts.side_effect = lambda texts: map(simple_segmenter, texts)
 
     alto_input = ALTOInput(input_file=FIXTURE_ALTO_ZIPFILE)
     sentences = list(alto_input.get_sentences())
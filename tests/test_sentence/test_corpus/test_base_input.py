@@ -53,11 +53,11 @@ def test_get_text(tmp_path: pathlib.Path):
         base_input.get_text()
 
 
-@patch("remarx.sentence.corpus.base_input.segment_text")
+@patch("remarx.sentence.corpus.base_input.segment_texts")
 @patch.object(FileInput, "get_text")
 def test_get_sentences(mock_text, mock_segment, tmp_path: pathlib.Path):
     # Use valid sentences that won't be filtered out (3+ words)
-    mock_segment.side_effect = lambda x: [(0, x)]
+    mock_segment.side_effect = lambda texts: ([(0, x)] for x in texts)
     mock_text.return_value = [
         {"id": i, "text": f"This is sentence {i} with enough words."} for i in range(3)
     ]
@@ -76,6 +76,43 @@ def test_get_sentences(mock_text, mock_segment, tmp_path: pathlib.Path):
         }
 
 
+@patch("remarx.sentence.corpus.base_input.segment_texts")
+@patch.object(FileInput, "get_text")
+def test_get_sentences_skips_short_chunks(
+    mock_text, mock_segment, tmp_path: pathlib.Path, caplog
+):
+    segmented_texts = []
+
+    def segmenter(texts):
+        for text in texts:
+            segmented_texts.append(text)
+            yield [(0, text)]
+
+    mock_segment.side_effect = segmenter
+    mock_text.return_value = [
+        {"text": "This is long enough."},
+        {"text": ""},
+        {"text": "  12. "},
+        {"text": "Two words"},
+        {"text": "Another long enough sentence."},
+    ]
+    base_input = FileInput(input_file=tmp_path / "test.txt")
+
+    with caplog.at_level("INFO"):
+        results = list(base_input.get_sentences())
+    # chunks with fewer than min_words words are not segmented
+    assert segmented_texts == [
+        "This is long enough.",
+        "Another long enough sentence.",
+    ]
+    assert [result["text"] for result in results] == segmented_texts
+    assert [result["sent_index"] for result in results] == [0, 1]
+    # skipped chunks with text are reported; empty chunks are not counted
+    assert (
+        "Omitted 2 short text chunks (fewer than 3 words) from test.txt" in caplog.text
+    )
+
+
 def test_create_txt(tmp_path: pathlib.Path):
     from remarx.sentence.corpus.text_input import TextInput
 
@@ -213,19 +250,22 @@ class TestSentenceValidation:
         assert base_input.include_sentence("The letter p appears here.")
 
 
-@patch("remarx.sentence.corpus.base_input.segment_text")
+@patch("remarx.sentence.corpus.base_input.segment_texts")
 @patch.object(FileInput, "get_text")
 def test_get_sentences_filters_invalid_sentences(
     mock_text, mock_segment, tmp_path: pathlib.Path, caplog
 ):
     """Test that get_sentences filters out invalid sentences."""
-    # Mock segment_text to return various sentences
-    mock_segment.side_effect = lambda x: [
-        (0, "Short."),  # 1 word - should be dropped
-        (8, "Two words."),  # 2 words - should be dropped
-        (20, "..."),  # punctuation only - should be dropped
-        (24, "This is a valid sentence."),  # 5 words - should be kept
-        (52, "Another good sentence here."),  # 4 words - should be kept
+    # Mock segment_texts to return various sentences
+    mock_segment.side_effect = lambda texts: [
+        [
+            (0, "Short."),  # 1 word - should be dropped
+            (8, "Two words."),  # 2 words - should be dropped
+            (20, "..."),  # punctuation only - should be dropped
+            (24, "This is a valid sentence."),  # 5 words - should be kept
+            (52, "Another good sentence here."),  # 4 words - should be kept
+        ]
+        for _text in texts
     ]
     mock_text.return_value = [{"text": "Mock text chunk"}]
 
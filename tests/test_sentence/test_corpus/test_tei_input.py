@@ -12,6 +12,8 @@ from remarx.sentence.corpus.tei_input import (
     TEIFootnote,
     TEIinput,
     TEIParagraph,
+    split_offsets,
+    value_at_offset,
 )
 
 FIXTURE_DIR = pathlib.Path(__file__).parent / "fixtures"
@@ -24,6 +26,19 @@ def test_tei_tag():
     assert TEI_TAG.pb == "{http://www.tei-c.org/ns/1.0}pb"
 
 
+def test_value_at_offset():
+    offset_values = split_offsets({0: 12, 40: 13, 95: 14})
+    assert offset_values == ([0, 40, 95], [12, 13, 14])
+    # returns value for the last offset at or before the character index
+    assert value_at_offset(offset_values, 0) == 12
+    assert value_at_offset(offset_values, 39) == 12
+    assert value_at_offset(offset_values, 40) == 13
+    assert value_at_offset(offset_values, 500) == 14
+    # no offset at or before the character index
+    assert value_at_offset(split_offsets({10: "5"}), 3) is None
+    assert value_at_offset(split_offsets({}), 3) is None
+
+
 class TestTEIDocument:
     def test_init_from_file(self):
         tei_doc = TEIDocument.init_from_file(TEST_TEI_FILE)
@@ -289,33 +304,41 @@ class TestTEIinput:
         # metadata should include line number AND page number
         assert extra_meta == {"page_number": "14", "line_number": 1}
 
-    @patch("remarx.sentence.corpus.base_input.segment_text")
-    def test_get_sentences(self, mock_segment_text: Mock):
+    @patch("remarx.sentence.corpus.base_input.segment_texts")
+    def test_get_sentences(self, mock_segment_texts: Mock):
         tei_input = TEIinput(input_file=TEST_TEI_FILE)
-        # segment text returns a tuple of character index, sentence text
-        mock_segment_text.return_value = [(0, "Aber abgesehn hiervon")]
+        # segment texts returns a list of tuples of character index,
+        # sentence text for each input text
+        mock_segment_texts.side_effect = lambda texts: (
+            [(0, "Aber abgesehn hiervon")] for _text in texts
+        )
         sentences = tei_input.get_sentences()
         # expect a generator with one item, with the content added to the file
         assert isinstance(sentences, Generator)
         sentences = list(sentences)
-        assert len(sentences) == 8  # 6 paragraphs + 2 heads, one mock sentence each
-        # method called once for each page of text
-        assert mock_segment_text.call_count == 8
+        # 6 paragraphs + 1 head, one mock sentence each;
+        # two-word heading is too short to include and is not segmented
+        assert len(sentences) == 7
+        # all chunks of text are segmented in a single call
+        mock_segment_texts.assert_called_once()
         assert all(isinstance(sentence, dict) for sentence in sentences)
         # file id set (handled by base input class)
         assert sentences[0]["file"] == TEST_TEI_FILE.name
         # page number set
-        assert sentences[2]["page_number"] == "12"
-        assert sentences[7]["page_number"] == "13"
+        assert sentences[1]["page_number"] == "12"
+        assert sentences[6]["page_number"] == "13"
         # sentence index is set and continues across pages
         sent_indices = [s["sent_index"] for s in sentences]
-        assert sent_indices == list(range(8))
+        assert sent_indices == list(range(7))
 
-    @patch("remarx.sentence.corpus.base_input.segment_text")
-    def test_get_sentences_with_footnotes(self, mock_segment_text: Mock):
+    @patch("remarx.sentence.corpus.base_input.segment_texts")
+    def test_get_sentences_with_footnotes(self, mock_segment_texts: Mock):
         tei_input = TEIinput(input_file=TEST_TEI_WITH_FOOTNOTES_FILE)
-        # segment text returns a tuple of character index, sentence text
-        mock_segment_text.return_value = [(0, "Aber abgesehn hiervon")]
+        # segment texts returns a list of tuples of character index,
+        # sentence text for each input text
+        mock_segment_texts.side_effect = lambda texts: (
+            [(0, "Aber abgesehn hiervon")] for _text in texts
+        )
         sentences = tei_input.get_sentences()
         # expect a generator
         assert isinstance(sentences, Generator)
@@ -49,14 +49,14 @@ def simple_segmenter(text: str):
     return ((0, text[:half_text_len]), (half_text_len, text[half_text_len:]))
 
 
-@patch("remarx.sentence.corpus.base_input.segment_text")
-def test_get_sentences(mock_segment_text: Mock, tmp_path: pathlib.Path):
+@patch("remarx.sentence.corpus.base_input.segment_texts")
+def test_get_sentences(mock_segment_texts: Mock, tmp_path: pathlib.Path):
     txt_file = tmp_path / "input.txt"
     # Use longer text that creates valid sentences after segmentation
     text_content = "This is the first sentence with enough words. This is the second sentence with enough words."
     txt_file.write_text(text_content)
     # call simple segmenter to split input text in two
-    mock_segment_text.side_effect = simple_segmenter
+    mock_segment_texts.side_effect = lambda texts: map(simple_segmenter, texts)
 
     txt_input = TextInput(input_file=txt_file)
     sentences = txt_input.get_sentences()
@@ -67,7 +67,7 @@ def test_get_sentences(mock_segment_text: Mock, tmp_path: pathlib.Path):
     assert len(sentences) == 2
 
     # expect segmentation method to be called only once
-    mock_segment_text.assert_called_once()
+    mock_segment_texts.assert_called_once()
 
     first_sentence = sentences[0]
     assert isinstance(first_sentence, dict)
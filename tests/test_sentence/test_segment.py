@@ -4,9 +4,18 @@ Unit tests for sentence segmentation functionality.
 
 from unittest.mock import Mock, patch
 
+import pytest
 from spacy.tokens import Span
 
-from remarx.sentence.segment import segment_text
+from remarx.sentence.segment import load_pipeline, segment_text, segment_texts
+
+
+@pytest.fixture(autouse=True)
+def clear_pipeline_cache():
+    # ensure cached spacy pipelines don't leak between tests
+    load_pipeline.cache_clear()
+    yield
+    load_pipeline.cache_clear()
 
 
 def create_mock_sentence(text: str, start_char: int = 0) -> Mock:
@@ -14,6 +23,22 @@ def create_mock_sentence(text: str, start_char: int = 0) -> Mock:
     return Mock(spec=Span, text=text, start_char=start_char)
 
 
+@patch("remarx.sentence.segment.spacy.load")
+def test_load_pipeline(mock_spacy_load: Mock) -> None:
+    nlp = load_pipeline("de_core_news_sm")
+    assert nlp == mock_spacy_load.return_value
+    mock_spacy_load.assert_called_once_with("de_core_news_sm")
+
+    # subsequent calls for the same model reuse the loaded pipeline
+    assert load_pipeline("de_core_news_sm") is nlp
+    mock_spacy_load.assert_called_once()
+
+    # a different model is loaded separately
+    load_pipeline("en_core_web_sm")
+    mock_spacy_load.assert_called_with("en_core_web_sm")
+    assert mock_spacy_load.call_count == 2
+
+
 class TestSegmentTextIntoSentences:
     """Test cases for the segment_text_into_sentences function."""
 
@@ -111,3 +136,32 @@ class TestSegmentTextIntoSentences:
         mock_logger.info.assert_called_once_with(
             "Downloading spaCy model: 'de_core_news_sm'"
         )
+
+
+class TestSegmentTexts:
+    """Test cases for the batched segment_texts function."""
+
+    @patch("remarx.sentence.segment.spacy.load")
+    def test_segment_texts(self, mock_spacy_load: Mock) -> None:
+        """Test batched segmentation returns sentences per input text."""
+        doc1 = Mock(sents=[create_mock_sentence("Erster Satz.", 0)])
+        doc2 = Mock(
+            sents=[
+                create_mock_sentence("Zweiter Satz.", 0),
+                create_mock_sentence("Dritter Satz.", 14),
+            ]
+        )
+        mock_nlp = Mock()
+        mock_nlp.pipe.return_value = iter([doc1, doc2])
+        mock_spacy_load.return_value = mock_nlp
+
+        texts = ["Erster Satz.", "Zweiter Satz. Dritter Satz."]
+        result = list(segment_texts(texts, batch_size=10))
+
+        assert result == [
+            [(0, "Erster Satz.")],
+            [(0, "Zweiter Satz."), (14, "Dritter Satz.")],
+        ]
+        # model is loaded once and texts are passed through to spacy pipe
+        mock_spacy_load.assert_called_once_with("de_core_news_sm")
+        mock_nlp.pipe.assert_called_once_with(texts, batch_size=10)